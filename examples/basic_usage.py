@@ -7,6 +7,14 @@ This example demonstrates the simplest way to use the library to detect meetings
 
 import time
 from meeting_detection import init, is_meeting_active, get_last_detection_details
+# Same adaptive schedule as the background engine: poll quickly right after a
+# change, back off while nothing changes
+from meeting_detection.engine import (
+    POLL_INTERVAL_BASE,
+    POLL_INTERVAL_MAX,
+    POLL_INTERVAL_MIN,
+    next_poll_interval,
+)
 
 
 def main():
@@ -14,14 +22,30 @@ def main():
     print("Initializing meeting detection...")
     init()
 
-    print("Checking meeting status every 5 seconds...")
+    print(
+        f"Checking meeting status every {POLL_INTERVAL_BASE} seconds "
+        f"({POLL_INTERVAL_MIN} right after a change, "
+        f"backing off to {POLL_INTERVAL_MAX} while nothing changes)..."
+    )
     print("Press Ctrl+C to stop\n")
 
+    interval = None
+    last_active = None
+
     try:
         while True:
             # Check if a meeting is currently active
             active = is_meeting_active()
 
+            # Adapt the polling interval to how recently the state changed;
+            # the first wait is the base interval, backoff starts after it
+            state_changed = last_active is not None and active != last_active
+            if interval is None:
+                interval = POLL_INTERVAL_BASE
+            else:
+                interval = next_poll_interval(interval, state_changed)
+            last_active = active
+
             if active:
                 # Get detailed information about the detection
                 details = get_last_detection_details()
@@ -44,7 +68,7 @@ def main():
             else:
                 print("✗ No meeting detected")
 
-            time.sleep(5)
+            time.sleep(interval)
 
     except KeyboardInterrupt:
         print("\nStopped monitoring.")
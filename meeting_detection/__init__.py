@@ -35,20 +35,17 @@ from .engine import get_engine
 from .models import DetectionDetails, SignalsBreakdown
 
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
-
-
 def init():
     """
     Initialize and start the meeting detection engine.
 
-    Starts background polling every 2 seconds to detect meeting state changes.
+    Starts adaptive background polling (2s base interval, 0.5s after a state
+    change, backing off to 10s while stable) to detect meeting state changes.
     This must be called before using other functions.
 
+    Installs a basic INFO-level logging handler only if the root logger has
+    no handlers yet, so an application's own logging setup is left alone.
+
     Example:
         ```python
         from meeting_detection import init
@@ -57,6 +54,13 @@ def init():
 
     Maps to init() in src/lib.rs lines 343-354
     """
+    # Configure logging only if the host application hasn't already
+    if not logging.getLogger().handlers:
+        logging.basicConfig(
+            level=logging.INFO,
+            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        )
+
     engine = get_engine()
     engine.start_polling()
     logging.getLogger(__name__).info("Meeting detection engine initialized and started")
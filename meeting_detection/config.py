@@ -5,8 +5,29 @@ This module defines meeting apps, URL patterns, and validation logic.
 CRITICAL: Must match src/config.rs exactly for accuracy parity.
 """
 
+import re
 import subprocess
-from typing import List
+import threading
+import time
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+try:
+    import ahocorasick  # Optional: pip install meeting-status-py[fast]
+except ImportError:
+    ahocorasick = None
+
+try:
+    import hyperscan  # Optional: pip install meeting-status-py[fast]
+except ImportError:
+    hyperscan = None
+
+try:
+    from AppKit import NSBundle, NSWorkspace  # Optional: pip install meeting-status-py[macos]
+except ImportError:
+    NSBundle = None
+    NSWorkspace = None
 
 
 # Meeting application process names (from src/config.rs lines 7-31)
@@ -147,6 +168,144 @@ BROWSER_REGISTRY = {
 }
 
 
+# Lowercased pattern tuples, precomputed once so the is_* helpers below
+# don't re-lowercase every static pattern on every call.
+_MEETING_PROCESSES_LC = tuple(p.lower() for p in MEETING_PROCESSES)
+_MEETING_WINDOW_PATTERNS_LC = tuple(p.lower() for p in MEETING_WINDOW_PATTERNS)
+_MEETING_URL_PATTERNS_LC = tuple(p.lower() for p in MEETING_URL_PATTERNS)
+_BROWSER_PROCESSES_LC = tuple(p.lower() for p in BROWSER_PROCESSES)
+# (browser name, AppleScript name, both lowercased) per BROWSER_REGISTRY entry
+_BROWSER_REGISTRY_LC = tuple(
+    (browser_name, applescript_name, browser_name.lower(), applescript_name.lower())
+    for browser_name, applescript_name in BROWSER_REGISTRY.items()
+)
+
+
+def _minimal_patterns(patterns: Sequence[str]) -> tuple:
+    """
+    Drop patterns that contain another pattern as a substring.
+    They can never change the result of a substring match, e.g. "zoom"
+    already matches everything "zoom.us" or "zoomopener" would.
+    """
+    unique = list(dict.fromkeys(patterns))
+    return tuple(
+        p for p in unique
+        if not any(other != p and other in p for other in unique)
+    )
+
+
+# Meeting process names: exact lowercase names are a hashed O(1) hit;
+# everything else falls back to substring matching on the reduced list.
+_MEETING_PROC_EXACT = frozenset(_MEETING_PROCESSES_LC)
+_MEETING_PROC_FUZZY = _minimal_patterns(_MEETING_PROCESSES_LC)
+
+# Same split for browser process names
+_BROWSER_EXACT = frozenset(_BROWSER_PROCESSES_LC)
+_BROWSER_FUZZY = _minimal_patterns(_BROWSER_PROCESSES_LC)
+
+# Lowercased process names of native meeting apps that are never browsers,
+# derived so it can't drift from MEETING_PROCESSES / BROWSER_PROCESSES.
+# The detector skips the (potentially subprocess-backed) browser probe for these.
+NATIVE_MEETING_PROCESSES = _MEETING_PROC_EXACT - _BROWSER_EXACT
+
+
+def _build_automaton(patterns: Sequence[str]) -> Optional["ahocorasick.Automaton"]:
+    """
+    Build an Aho-Corasick automaton over the given (lowercased) patterns.
+
+    Returns None when pyahocorasick is not installed.
+    """
+    if ahocorasick is None:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for pattern in patterns:
+        automaton.add_word(pattern, pattern)
+    automaton.make_automaton()
+    return automaton
+
+
+def _contains_any(text_lower: str, automaton, patterns: Sequence[str]) -> bool:
+    """
+    Check if any pattern is a substring of text_lower.
+    Uses a single automaton scan when available, otherwise a substring loop.
+    """
+    if automaton is not None:
+        return next(automaton.iter(text_lower), None) is not None
+    return any(pattern in text_lower for pattern in patterns)
+
+
+_MEETING_PROC_AC = _build_automaton(_MEETING_PROC_FUZZY)
+_WINDOW_AC = _build_automaton(_MEETING_WINDOW_PATTERNS_LC)
+_URL_AC = _build_automaton(_MEETING_URL_PATTERNS_LC)
+
+# Single alternation over the non-Google-Meet URL patterns, used when
+# pyahocorasick is not installed.
+_URL_REGEX = re.compile('|'.join(re.escape(p) for p in _MEETING_URL_PATTERNS_LC))
+_BROWSER_PROC_AC = _build_automaton(_BROWSER_FUZZY)
+
+
+def _build_url_database() -> Optional["hyperscan.Database"]:
+    """
+    Compile MEETING_URL_PATTERNS into one caseless Hyperscan database.
+
+    Returns None when hyperscan is not installed.
+    """
+    if hyperscan is None:
+        return None
+
+    database = hyperscan.Database()
+    database.compile(
+        expressions=[re.escape(p).encode() for p in _MEETING_URL_PATTERNS_LC],
+        ids=list(range(len(_MEETING_URL_PATTERNS_LC))),
+        elements=len(_MEETING_URL_PATTERNS_LC),
+        flags=[hyperscan.HS_FLAG_CASELESS] * len(_MEETING_URL_PATTERNS_LC),
+    )
+    return database
+
+
+_URL_HS_DB = _build_url_database()
+# The database's scratch space is shared, so scans must not overlap
+_URL_HS_LOCK = threading.Lock()
+
+
+# Hosts every meeting URL pattern lives under (the part before the first "/"),
+# e.g. "zoom.us" or "webex.com". Subdomains such as "us02web.zoom.us" match too.
+_MEETING_URL_HOSTS = frozenset(
+    p.split('/', 1)[0].lstrip('.') for p in _MEETING_URL_PATTERNS_LC
+)
+
+
+def _url_host(url_lower: str) -> str:
+    """Extract the host from a lowercased URL without a full urlsplit()."""
+    _, sep, rest = url_lower.partition('://')
+    if not sep:
+        rest = url_lower
+
+    end = len(rest)
+    for delim in '/?#':
+        idx = rest.find(delim, 0, end)
+        if idx >= 0:
+            end = idx
+
+    # Drop userinfo and port
+    return rest[:end].rpartition('@')[2].partition(':')[0]
+
+
+def _is_meeting_host(host: str) -> bool:
+    """Check if host or any of its parent domains is a meeting URL host."""
+    while host:
+        if host in _MEETING_URL_HOSTS:
+            return True
+        host = host.partition('.')[2]
+    return False
+
+
+_GMEET_PREFIX = 'meet.google.com/'
+_GMEET_EXCLUDED_PATHS = frozenset({'landing', 'new', 'join', ''})
+_GMEET_CODE_RE = re.compile(r'[a-z]{2,5}-[a-z]{2,5}-[a-z]{2,5}')
+
+
 def is_valid_google_meet_code(code: str) -> bool:
     """
     CRITICAL: Exact port of Rust logic from src/config.rs lines 95-132
@@ -165,34 +324,13 @@ def is_valid_google_meet_code(code: str) -> bool:
     - Invalid: "ABC-def-ghi" (uppercase)
     - Invalid: "abc-d3f-ghi" (contains digit)
     """
-    if not code:
+    # 3 hyphen-separated segments of 2-5 lowercase letters (a-z) each
+    if not code or _GMEET_CODE_RE.fullmatch(code) is None:
         return False
 
-    # Split by hyphens to get segments
-    segments = code.split('-')
-
-    # Must have exactly 3 segments
-    if len(segments) != 3:
-        return False
-
-    # Each segment must:
-    # 1. Be non-empty
-    # 2. Contain only lowercase letters (a-z)
-    # 3. Be between 2-5 characters
-    for segment in segments:
-        if not segment or len(segment) < 2 or len(segment) > 5:
-            return False
-
-        # Must be all lowercase letters
-        if not segment.isalpha() or not segment.islower():
-            return False
-
     # Total code length (excluding hyphens) should be reasonable
-    total_chars = sum(len(s) for s in segments)
-    if total_chars < 8 or total_chars > 15:
-        return False
-
-    return True
+    total_chars = len(code) - 2
+    return 8 <= total_chars <= 15
 
 
 def is_meeting_url(url: str) -> bool:
@@ -208,31 +346,82 @@ def is_meeting_url(url: str) -> bool:
 
     Other Services (Teams, Webex, Zoom web):
     - Uses pattern matching on URL strings
+
+    URLs whose host is not a known meeting domain (or a subdomain of one)
+    are rejected up front with a set lookup, before any pattern matching.
     """
     url_lower = url.lower()
 
-    # Special handling for Google Meet: must have a valid meeting code
-    if 'meet.google.com/' in url_lower:
-        # Extract the path after meet.google.com/
-        path_start = url_lower.find('meet.google.com/')
-        if path_start == -1:
-            return False
-
-        after_domain = url_lower[path_start + len('meet.google.com/'):]
+    # Fast path: most tabs are not on a meeting domain at all
+    if not _is_meeting_host(_url_host(url_lower)):
+        return False
 
-        # Extract path segment before query params (# or ?)
-        path_segment = after_domain.split('?')[0].split('#')[0].rstrip('/')
+    # Special handling for Google Meet: must have a valid meeting code
+    path_start = url_lower.find(_GMEET_PREFIX)
+    if path_start >= 0:
+        # Extract path segment after meet.google.com/ and before query params
+        # (# or ?) by index, without intermediate split lists
+        start = path_start + len(_GMEET_PREFIX)
+        end = len(url_lower)
+        for delim in '?#':
+            idx = url_lower.find(delim, start, end)
+            if idx >= 0:
+                end = idx
+        path_segment = url_lower[start:end].rstrip('/')
 
         # Exclude non-meeting pages
-        excluded_paths = ['landing', 'new', 'join', '']
-        if path_segment in excluded_paths:
+        if path_segment in _GMEET_EXCLUDED_PATHS:
             return False
 
         # Validate if it's a proper meeting code
         return is_valid_google_meet_code(path_segment)
 
     # For other services, use simple pattern matching
-    return any(pattern in url_lower for pattern in MEETING_URL_PATTERNS)
+    if _URL_AC is not None:
+        return next(_URL_AC.iter(url_lower), None) is not None
+    return _URL_REGEX.search(url_lower) is not None
+
+
+def find_meeting_url(urls: Sequence[str]) -> int:
+    """
+    Find the first meeting URL in a batch of URLs.
+
+    Every meeting URL contains one of MEETING_URL_PATTERNS, so with hyperscan
+    installed all URLs are scanned in a single pass to find candidates, and
+    only those go through is_meeting_url(). Without it, each URL is checked
+    in turn. Hyperscan scans are serialized on _URL_HS_LOCK because the
+    database's scratch space can't be used by two scans at once.
+
+    Returns:
+        Index of the first URL for which is_meeting_url() is True, or -1
+    """
+    if _URL_HS_DB is None or len(urls) < 2:
+        for i, url in enumerate(urls):
+            if is_meeting_url(url):
+                return i
+        return -1
+
+    # NUL-delimited buffer; starts[i] is the byte offset of urls[i]
+    encoded = [url.encode('utf-8', 'replace') for url in urls]
+    starts = []
+    offset = 0
+    for data in encoded:
+        starts.append(offset)
+        offset += len(data) + 1
+
+    candidates = set()
+
+    def on_match(_id, _start, end, _flags, _context):
+        candidates.add(bisect_right(starts, end - 1) - 1)
+
+    buffer = b'\0'.join(encoded)
+    with _URL_HS_LOCK:
+        _URL_HS_DB.scan(buffer, match_event_handler=on_match)
+
+    for i in sorted(candidates):
+        if is_meeting_url(urls[i]):
+            return i
+    return -1
 
 
 def is_meeting_process(process_name: str) -> bool:
@@ -240,8 +429,17 @@ def is_meeting_process(process_name: str) -> bool:
     Check if a process name matches any meeting app.
     From src/config.rs lines 176-181
     """
-    process_lower = process_name.lower()
-    return any(app.lower() in process_lower for app in MEETING_PROCESSES)
+    return is_meeting_process_lower(process_name.lower())
+
+
+def is_meeting_process_lower(process_lower: str) -> bool:
+    """
+    Same as is_meeting_process() for an already-lowercased process name.
+    Lets callers lowercase a whole process list once per poll.
+    """
+    if process_lower in _MEETING_PROC_EXACT:
+        return True
+    return _contains_any(process_lower, _MEETING_PROC_AC, _MEETING_PROC_FUZZY)
 
 
 def is_meeting_window(window_title: str) -> bool:
@@ -250,7 +448,7 @@ def is_meeting_window(window_title: str) -> bool:
     From src/config.rs lines 184-189
     """
     title_lower = window_title.lower()
-    return any(pattern in title_lower for pattern in MEETING_WINDOW_PATTERNS)
+    return _contains_any(title_lower, _WINDOW_AC, _MEETING_WINDOW_PATTERNS_LC)
 
 
 def is_browser_process_pattern(process_name: str) -> bool:
@@ -259,18 +457,168 @@ def is_browser_process_pattern(process_name: str) -> bool:
     From src/config.rs lines 245-250
     """
     process_lower = process_name.lower()
-    return any(browser.lower() in process_lower for browser in BROWSER_PROCESSES)
+    if process_lower in _BROWSER_EXACT:
+        return True
+    return _contains_any(process_lower, _BROWSER_PROC_AC, _BROWSER_FUZZY)
+
+
+# Bundle identifiers of known browsers (substring-matched, case-insensitive)
+BROWSER_BUNDLE_IDS = (
+    'com.google.chrome',
+    'com.microsoft.edgemac',
+    'com.brave.browser',
+    'com.operasoftware.opera',
+    'com.vivaldi.vivaldi',
+    'org.mozilla.firefox',
+    'com.apple.safari',
+    'org.torproject.torbrowser',
+    'com.duckduckgo.mac.browser',
+    'com.epicbrowser.epic',
+)
+
+
+def get_running_app_bundle_ids() -> Dict[str, str]:
+    """
+    Map running GUI app names to their bundle identifiers.
 
+    Uses NSWorkspace in-process, so no subprocess is spawned. Intended to be
+    built once per poll and passed to is_browser_process_macos().
 
-def is_browser_process_macos(process_name: str) -> bool:
+    Returns an empty dict if PyObjC is not installed.
+    """
+    if NSWorkspace is None:
+        return {}
+
+    apps = {}
+    for app in NSWorkspace.sharedWorkspace().runningApplications():
+        name = app.localizedName()
+        bundle_id = app.bundleIdentifier()
+        if name and bundle_id:
+            apps[str(name)] = str(bundle_id)
+    return apps
+
+
+def _is_browser_bundle(bundle_id: str) -> bool:
+    """
+    Check a bundle identifier against known browsers, then against the
+    bundle's LSApplicationCategoryType (what mdls reports as
+    kMDItemAppStoreCategoryType). Requires PyObjC.
+    """
+    bundle_id_lower = bundle_id.lower()
+    if any(bid in bundle_id_lower for bid in BROWSER_BUNDLE_IDS):
+        return True
+
+    try:
+        app_url = NSWorkspace.sharedWorkspace().URLForApplicationWithBundleIdentifier_(bundle_id)
+        bundle = NSBundle.bundleWithURL_(app_url) if app_url is not None else None
+        category = bundle.objectForInfoDictionaryKey_('LSApplicationCategoryType') if bundle else None
+    except Exception:
+        category = None
+
+    return bool(category) and 'browser' in str(category).lower()
+
+
+# Bundle categories don't change while an app is running, so probe results
+# are cached per process name and only re-checked after this many seconds.
+BROWSER_PROBE_TTL_SEC = 300.0
+_BROWSER_PROBE_CACHE_MAX = 256
+_browser_probe_cache: Dict[str, Tuple[float, bool]] = {}
+
+
+def is_browser_process_macos(
+    process_name: str,
+    running_apps: Optional[Dict[str, str]] = None
+) -> bool:
     """
     Check if a process is a browser on macOS using bundle categories.
     Uses mdls to check if the app's bundle category includes browser categories.
     From src/config.rs lines 254-404
 
+    Known browsers from BROWSER_REGISTRY return immediately; other results
+    are cached for BROWSER_PROBE_TTL_SEC to avoid re-spawning osascript/mdls
+    on every poll. With PyObjC installed the bundle is looked up in-process
+    instead of via osascript/mdls.
+
+    Args:
+        process_name: Process name to check
+        running_apps: Optional name -> bundle id snapshot from
+                      get_running_app_bundle_ids(), reused across calls
+
     Returns True if the process is a browser, False otherwise.
     Falls back to pattern matching if bundle detection fails.
     """
+    if process_name in BROWSER_REGISTRY:
+        return True
+
+    now = time.monotonic()
+    cached = _browser_probe_cache.get(process_name)
+    if cached is not None and now - cached[0] < BROWSER_PROBE_TTL_SEC:
+        return cached[1]
+
+    if NSWorkspace is not None:
+        if running_apps is None:
+            running_apps = get_running_app_bundle_ids()
+        bundle_id = running_apps.get(process_name)
+        if bundle_id and _is_browser_bundle(bundle_id):
+            result = True
+        else:
+            result = is_browser_process_pattern(process_name)
+    else:
+        result = _probe_browser_process_macos(process_name)
+
+    if len(_browser_probe_cache) >= _BROWSER_PROBE_CACHE_MAX:
+        _browser_probe_cache.clear()
+    _browser_probe_cache[process_name] = (now, result)
+    return result
+
+
+# Shared pool for the I/O-bound mdls probes in _probe_browser_process_macos()
+_PROBE_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="md-probe")
+
+# (mdls attribute, predicate on its lowercased value) that mark a browser:
+# app store category type (most reliable), human-readable category name,
+# then bundle identifier as fallback.
+_MDLS_BROWSER_CHECKS = (
+    ('kMDItemAppStoreCategoryType',
+     lambda value: any(p in value for p in ('web-browser', 'web-browsers', 'browser'))),
+    ('kMDItemAppStoreCategory',
+     lambda value: 'browser' in value or 'web' in value),
+    ('kMDItemCFBundleIdentifier',
+     lambda value: any(bid in value for bid in BROWSER_BUNDLE_IDS)),
+)
+
+
+def _read_mdls(app_path: str, key: str) -> str:
+    """
+    Read one metadata attribute of an app bundle via mdls.
+    Returns "" if the attribute is missing or mdls fails.
+    """
+    result = subprocess.run(
+        ['mdls', '-name', key, app_path],
+        capture_output=True,
+        text=True,
+        timeout=5
+    )
+
+    # Parse mdls output: "kMDItemAppStoreCategoryType = "value"" or "(null)"
+    if result.returncode != 0 or '=' not in result.stdout:
+        return ""
+
+    value = result.stdout.split('=', 1)[1].strip().strip('"')
+    return "" if value == '(null)' else value
+
+
+def _mdls_indicates_browser(app_path: str, key: str, check: Callable[[str], bool]) -> bool:
+    """Check one mdls attribute against its browser predicate."""
+    try:
+        value = _read_mdls(app_path, key)
+    except Exception:
+        return False
+    return bool(value) and check(value.lower())
+
+
+def _probe_browser_process_macos(process_name: str) -> bool:
+    """Uncached bundle-category probe behind is_browser_process_macos()."""
     try:
         # First, try to find the app bundle path using AppleScript
         script = f'''
@@ -298,86 +646,16 @@ def is_browser_process_macos(process_name: str) -> bool:
 
         app_path = result.stdout.strip()
 
-        # Try to get app store category type (most reliable for browsers)
-        try:
-            category_result = subprocess.run(
-                ['mdls', '-name', 'kMDItemAppStoreCategoryType', app_path],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-
-            if category_result.returncode == 0:
-                output_str = category_result.stdout
-
-                # Parse mdls output: "kMDItemAppStoreCategoryType = "value"" or "(null)"
-                if '=' in output_str:
-                    category_value = output_str.split('=', 1)[1].strip().strip('"')
-                    category_lower = category_value.lower()
-
-                    # Check for browser-related categories
-                    browser_category_patterns = ['web-browser', 'web-browsers', 'browser']
-                    if category_value != '(null)' and category_value:
-                        if any(pattern in category_lower for pattern in browser_category_patterns):
-                            return True
-        except:
-            pass
-
-        # Also check the human-readable category name
-        try:
-            category_name_result = subprocess.run(
-                ['mdls', '-name', 'kMDItemAppStoreCategory', app_path],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-
-            if category_name_result.returncode == 0:
-                output_str = category_name_result.stdout
-
-                if '=' in output_str:
-                    category_name = output_str.split('=', 1)[1].strip().strip('"')
-                    category_lower = category_name.lower()
-
-                    if category_name != '(null)' and category_name:
-                        if 'browser' in category_lower or 'web' in category_lower:
-                            return True
-        except:
-            pass
-
-        # Check bundle identifier as fallback
-        try:
-            bundle_id_result = subprocess.run(
-                ['mdls', '-name', 'kMDItemCFBundleIdentifier', app_path],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-
-            if bundle_id_result.returncode == 0:
-                output_str = bundle_id_result.stdout
-
-                if '=' in output_str:
-                    bundle_id = output_str.split('=', 1)[1].strip().strip('"')
-                    bundle_id_lower = bundle_id.lower()
-
-                    browser_bundle_ids = [
-                        'com.google.chrome',
-                        'com.microsoft.edgemac',
-                        'com.brave.browser',
-                        'com.operasoftware.opera',
-                        'com.vivaldi.vivaldi',
-                        'org.mozilla.firefox',
-                        'com.apple.safari',
-                        'org.torproject.torbrowser',
-                        'com.duckduckgo.mac.browser',
-                        'com.epicbrowser.epic',
-                    ]
-
-                    if any(bid in bundle_id_lower for bid in browser_bundle_ids):
-                        return True
-        except:
-            pass
+        # Run the mdls probes concurrently and stop at the first browser hit
+        futures = [
+            _PROBE_POOL.submit(_mdls_indicates_browser, app_path, key, check)
+            for key, check in _MDLS_BROWSER_CHECKS
+        ]
+        for future in as_completed(futures):
+            if future.result():
+                for pending in futures:
+                    pending.cancel()
+                return True
 
         # Fall back to pattern matching if bundle detection fails
         return is_browser_process_pattern(process_name)
@@ -387,9 +665,12 @@ def is_browser_process_macos(process_name: str) -> bool:
         return is_browser_process_pattern(process_name)
 
 
-def is_browser_process(process_name: str) -> bool:
+def is_browser_process(
+    process_name: str,
+    running_apps: Optional[Dict[str, str]] = None
+) -> bool:
     """
     Check if a process is a browser.
     Uses macOS-specific detection first, falls back to pattern matching.
     """
-    return is_browser_process_macos(process_name)
+    return is_browser_process_macos(process_name, running_apps)
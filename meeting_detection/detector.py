@@ -9,14 +9,58 @@ Two-tier detection strategy:
 """
 
 import threading
-from typing import Optional, Tuple
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
 
-from .config import is_meeting_process, is_meeting_url
-from .network import detect_meeting_network_activity
+from .config import (
+    BROWSER_REGISTRY,
+    NATIVE_MEETING_PROCESSES,
+    find_meeting_url,
+    get_running_app_bundle_ids,
+    is_meeting_process_lower,
+)
+from .network import NetworkConnection, get_network_connections, has_meeting_network_activity
 from .platform import MacOSDetector, get_browser_tab_urls, is_browser_process
 from .models import DetectionResult, MeetingState
 
 
+@dataclass
+class _PollContext:
+    """
+    Snapshot of system state shared by both tiers within one detect() call.
+
+    Expensive probes are taken at most once per poll instead of once per
+    matching process.
+    """
+    native_apps: List[str] = field(default_factory=list)
+    _running_apps: Optional[Dict[str, str]] = None
+    _net_connections: Optional[List[NetworkConnection]] = None
+
+    @property
+    def running_apps(self) -> Dict[str, str]:
+        """
+        Running GUI app name -> bundle id, built on first use and reused for
+        the rest of the poll. Empty without PyObjC or if the lookup fails.
+        """
+        if self._running_apps is None:
+            try:
+                self._running_apps = get_running_app_bundle_ids()
+            except Exception:
+                self._running_apps = {}
+        return self._running_apps
+
+    @property
+    def net_connections(self) -> List[NetworkConnection]:
+        """
+        Network connections of native_apps, fetched in one snapshot on first
+        use and reused for the rest of the poll.
+        """
+        if self._net_connections is None:
+            self._net_connections = get_network_connections(self.native_apps)
+        return self._net_connections
+
+
 class MeetingDetector:
     """
     Main detector that combines all signals using two-tier algorithm.
@@ -32,7 +76,10 @@ class MeetingDetector:
         """
         self.platform = platform if platform is not None else MacOSDetector()
         self._previous_state = MeetingState.INACTIVE
+        self._last_result_key: Optional[Tuple[Optional[str], Optional[str], bool]] = None
         self._state_lock = threading.Lock()
+        self._inflight: Optional[Future] = None
+        self._inflight_lock = threading.Lock()
 
     def detect(self) -> DetectionResult:
         """
@@ -55,9 +102,35 @@ class MeetingDetector:
         - Teams/Webex web: Pattern matching on meeting URLs
         - Decision: If meeting URL detected → MEETING ACTIVE
 
+        Concurrent callers (e.g. the polling thread and is_meeting_active())
+        share a single in-flight detection instead of each running their own.
+
         Returns:
             DetectionResult with detection details
         """
+        with self._inflight_lock:
+            inflight = self._inflight
+            is_owner = inflight is None
+            if is_owner:
+                inflight = self._inflight = Future()
+
+        if not is_owner:
+            return inflight.result()
+
+        try:
+            result = self._detect_once()
+        except BaseException as e:
+            inflight.set_exception(e)
+            raise
+        else:
+            inflight.set_result(result)
+            return result
+        finally:
+            with self._inflight_lock:
+                self._inflight = None
+
+    def _detect_once(self) -> DetectionResult:
+        """Run one detection cycle; see detect()."""
         # Check microphone (for supporting info, not decision)
         try:
             microphone_active = self.platform.is_microphone_active()
@@ -76,52 +149,77 @@ class MeetingDetector:
         except Exception:
             processes = []
 
+        # Per-poll snapshot shared by both tiers, filled in lazily
+        ctx = _PollContext()
+
         # Window detection disabled for performance (not used in decision tree)
         meeting_window_detected = False
 
         # TIER 1: Check for native meeting apps (Zoom, Teams desktop, Webex desktop)
         # For native apps, network connections are the primary signal
-        for process_name in processes:
-            if is_meeting_process(process_name):
-                # Check if it's a browser first (browsers are handled in Tier 2)
+        # Filter the whole process list in one pass (lowercasing each name
+        # once); only the few matches go on to the expensive probes below.
+        # Keyed by name, so apps running several same-named processes are
+        # probed and network-checked once per poll.
+        meeting_candidates = {
+            process_name: process_lower
+            for process_name, process_lower in zip(processes, map(str.lower, processes))
+            if is_meeting_process_lower(process_lower)
+        }
+        for process_name, process_lower in meeting_candidates.items():
+            # Check if it's a browser first (browsers are handled in Tier 2).
+            # Known native apps skip the expensive browser probe.
+            if process_name in BROWSER_REGISTRY:
+                continue
+            if process_lower not in NATIVE_MEETING_PROCESSES:
                 try:
-                    if is_browser_process(process_name):
+                    if is_browser_process(process_name, ctx.running_apps):
                         continue  # Skip browsers, handle in Tier 2
                 except Exception:
                     pass
 
-                # It's a native meeting app - check network connections
-                try:
-                    has_network, _count, _details = detect_meeting_network_activity(process_name)
-
-                    if has_network:
-                        # Native app with network activity = active meeting
-                        return DetectionResult.create_native_app(
-                            app_name=process_name,
-                            microphone=microphone_active,
-                            camera=camera_active
-                        )
-                except Exception:
-                    # Network detection failed for this process, continue checking others
-                    pass
+            ctx.native_apps.append(process_name)
+
+        for process_name in ctx.native_apps:
+            # It's a native meeting app - check network connections
+            try:
+                if has_meeting_network_activity(process_name, ctx.net_connections):
+                    # Native app with network activity = active meeting
+                    return DetectionResult.create_native_app(
+                        app_name=process_name,
+                        microphone=microphone_active,
+                        camera=camera_active
+                    )
+            except Exception:
+                # Network detection failed for this process, continue checking others
+                pass
 
-                # No network connections = no active meeting for native apps
+            # No network connections = no active meeting for native apps
 
         # TIER 2: Check for browser-based meetings (Google Meet, Teams web, Webex web)
         # For browser-based meetings, meeting URLs are definitive
         try:
-            browser_urls_map = get_browser_tab_urls()
-
-            for browser_name, urls in browser_urls_map.items():
-                for url in urls:
-                    if is_meeting_url(url):
-                        # Browser with meeting URL = active meeting
-                        return DetectionResult.create_browser_meeting(
-                            browser_name=browser_name,
-                            url=url,
-                            microphone=microphone_active,
-                            camera=camera_active
-                        )
+            # Reuse Tier 1's app snapshot if it took one; otherwise the tab
+            # fetch builds its own only when the URL cache is stale
+            browser_urls_map = get_browser_tab_urls(ctx._running_apps)
+
+            # Match all tabs of all browsers in one batch
+            tabs = [
+                (browser_name, url)
+                for browser_name, urls in browser_urls_map.items()
+                for url in urls
+            ]
+            match_index = find_meeting_url([url for _browser, url in tabs])
+
+            if match_index >= 0:
+                # Browser with meeting URL = active meeting
+                browser_name, url = tabs[match_index]
+                return DetectionResult.create_browser_meeting(
+                    browser_name=browser_name,
+                    url=url,
+                    microphone=microphone_active,
+                    camera=camera_active
+                )
         except Exception:
             # Browser URL detection failed
             pass
@@ -134,15 +232,23 @@ class MeetingDetector:
         Perform detection and also compute state change in one pass.
         From src/detector.rs lines 165-186
 
+        Consecutive results with the same app, URL and active flag are
+        treated as unchanged and skip the state comparison entirely.
+
         Returns:
             Tuple of (DetectionResult, state_change)
             state_change is None if no change, or new MeetingState if changed
         """
         result = self.detect()
+        result_key = (result.meeting_app_name, result.reason_url, result.is_meeting_active)
 
         new_state = MeetingState.ACTIVE if result.is_meeting_active else MeetingState.INACTIVE
 
         with self._state_lock:
+            if result_key == self._last_result_key:
+                return (result, None)
+            self._last_result_key = result_key
+
             previous_state = self._previous_state
 
             if new_state != previous_state:
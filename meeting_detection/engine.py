@@ -1,39 +1,71 @@
 """
 Background polling engine with callbacks.
 
-Implements 2-second polling with state change detection and callback execution.
+Implements adaptive polling (2s base, 0.5s-10s range) with state change
+detection and callback execution.
 Maps to DetectionEngine in src/lib.rs lines 121-273
 """
 
-import asyncio
 import logging
 import threading
-from typing import Callable, List, Optional
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, Tuple
 
 from .detector import MeetingDetector
+from .network import clear_network_cache
 from .models import DetectionDetails, DetectionResult, MeetingEvent, MeetingState
 
 
 logger = logging.getLogger(__name__)
 
 
+# Adaptive polling: start at the base interval, drop to the minimum right
+# after a state change to catch quick transitions, and back off while the
+# state is stable.
+POLL_INTERVAL_BASE = 2.0
+POLL_INTERVAL_MIN = 0.5
+POLL_INTERVAL_MAX = 10.0
+POLL_BACKOFF_FACTOR = 1.5
+
+
+def next_poll_interval(interval: float, state_changed: bool) -> float:
+    """
+    Compute the delay before the next poll.
+
+    Args:
+        interval: Delay used before the current poll
+        state_changed: Whether the current poll saw a state change
+
+    Returns:
+        POLL_INTERVAL_MIN after a change, otherwise interval grown by
+        POLL_BACKOFF_FACTOR and capped at POLL_INTERVAL_MAX
+    """
+    if state_changed:
+        return POLL_INTERVAL_MIN
+    return min(POLL_INTERVAL_MAX, interval * POLL_BACKOFF_FACTOR)
+
+
 class DetectionEngine:
     """
-    Background polling engine that runs detection every 2 seconds.
+    Background polling engine that runs detection on an adaptive interval.
     Maps to DetectionEngine in src/lib.rs lines 121-273
     """
 
     def __init__(self):
         """Initialize the detection engine."""
         self.detector = MeetingDetector()
-        self._start_callbacks: List[Callable[[DetectionDetails], None]] = []
-        self._end_callbacks: List[Callable[[DetectionDetails], None]] = []
+        # Copy-on-write tuples: registration (rare) swaps in a new tuple, so
+        # the polling thread can read them without locking
+        self._start_callbacks: Tuple[Callable[[DetectionDetails], None], ...] = ()
+        self._end_callbacks: Tuple[Callable[[DetectionDetails], None], ...] = ()
         self._last_result: Optional[DetectionResult] = None
         self._is_running = False
-        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stop_event = threading.Event()
         self._thread: Optional[threading.Thread] = None
-        self._callback_lock = threading.Lock()
-        self._result_lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._callback_lock = threading.Lock()  # Serializes registrations
+        self._executor_lock = threading.Lock()
 
     def start_polling(self):
         """
@@ -44,52 +76,66 @@ class DetectionEngine:
             return  # Already running
 
         self._is_running = True
-        self._thread = threading.Thread(target=self._run_event_loop, daemon=True)
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._poll_loop, daemon=True)
         self._thread.start()
 
-    def _run_event_loop(self):
-        """Run async event loop in background thread."""
-        self._loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(self._loop)
-        try:
-            self._loop.run_until_complete(self._poll_loop())
-        finally:
-            self._loop.close()
-
-    async def _poll_loop(self):
+    def _poll_loop(self):
         """
-        Poll every 2 seconds and trigger callbacks on state changes.
+        Poll adaptively and trigger callbacks on state changes.
         From src/lib.rs lines 204-245
 
         Detects state changes (INACTIVE -> ACTIVE or ACTIVE -> INACTIVE)
-        and triggers appropriate callbacks.
+        and triggers appropriate callbacks. The first poll runs immediately
+        and the first wait is POLL_INTERVAL_BASE; after that the interval
+        resets to POLL_INTERVAL_MIN after a change and backs off towards
+        POLL_INTERVAL_MAX while the state is stable (2s, 3s, 4.5s, 6.75s,
+        then 10s when idle).
+
+        Polls are scheduled against monotonic deadlines, so detection time
+        doesn't add drift to the cadence. Sleeps on _stop_event, so
+        stop_polling() wakes the loop immediately.
         """
-        while self._is_running:
+        interval: Optional[float] = None
+        deadline = time.monotonic()
+
+        while not self._stop_event.is_set():
+            state_change = None
             try:
                 # Perform detection with state tracking
                 result, state_change = self.detector.detect_with_state()
 
-                # Store last detection result BEFORE sending event
-                with self._result_lock:
-                    self._last_result = result
+                # Store last detection result BEFORE sending event.
+                # A single reference swap is atomic; results are never mutated.
+                self._last_result = result
 
                 # Trigger callbacks if state changed
                 if state_change == MeetingState.ACTIVE:
-                    app_name = result.meeting_app_name or "unknown"
-                    reason_str = self._get_reason_str(result)
-                    logger.info(f"Meeting started: {app_name} ({reason_str})")
+                    if logger.isEnabledFor(logging.INFO):
+                        app_name = result.meeting_app_name or "unknown"
+                        reason_str = self._get_reason_str(result)
+                        logger.info("Meeting started: %s (%s)", app_name, reason_str)
                     self._trigger_callbacks(self._start_callbacks, result)
 
                 elif state_change == MeetingState.INACTIVE:
-                    app_name = result.meeting_app_name or "none"
-                    logger.info(f"Meeting ended: {app_name}")
+                    logger.info("Meeting ended: %s", result.meeting_app_name or "none")
                     self._trigger_callbacks(self._end_callbacks, result)
 
             except Exception as e:
-                logger.error(f"Detection error: {e}")
-
-            # Wait 2 seconds before next poll
-            await asyncio.sleep(2)
+                logger.error("Detection error: %s", e)
+
+            if interval is None and state_change is None:
+                # Backoff only starts after the first full base interval
+                interval = POLL_INTERVAL_BASE
+            else:
+                interval = next_poll_interval(interval or POLL_INTERVAL_BASE, state_change is not None)
+            deadline += interval
+            remaining = deadline - time.monotonic()
+            if remaining > 0:
+                self._stop_event.wait(remaining)
+            else:
+                # Detection overran the interval; resync instead of bursting
+                deadline = time.monotonic()
 
     def _get_reason_str(self, result: DetectionResult) -> str:
         """Extract reason string from detection result."""
@@ -100,35 +146,41 @@ class DetectionEngine:
         else:
             return "None"
 
-    def _trigger_callbacks(self, callbacks: List[Callable], result: DetectionResult):
+    def _trigger_callbacks(self, callbacks: Tuple[Callable, ...], result: DetectionResult):
         """
-        Execute callbacks in separate threads.
+        Execute callbacks on the engine's worker pool.
         From src/lib.rs lines 164-186
 
-        Callbacks are executed in separate threads to prevent blocking
-        the detection loop.
+        Callbacks run on pooled worker threads to prevent blocking the
+        detection loop, without creating a new thread per callback.
+        Does nothing (not even building DetectionDetails) when no callbacks
+        are registered.
         """
+        # Immutable snapshot; no copy or lock needed
+        callback_list = callbacks
+        if not callback_list:
+            return
+
         # Convert internal result to public-facing details
         details = DetectionDetails.from_detection_result(result)
 
-        with self._callback_lock:
-            callback_list = callbacks.copy()
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=min(8, max(2, len(callback_list))),
+                    thread_name_prefix="md-cb"
+                )
+            executor = self._executor
 
-        # Execute each callback in a separate thread
         for callback in callback_list:
-            thread = threading.Thread(
-                target=self._safe_callback_wrapper,
-                args=(callback, details),
-                daemon=True
-            )
-            thread.start()
+            executor.submit(self._safe_callback_wrapper, callback, details)
 
     def _safe_callback_wrapper(self, callback: Callable, details: DetectionDetails):
         """Wrapper to catch and log callback exceptions."""
         try:
             callback(details)
         except Exception as e:
-            logger.error(f"Callback error: {e}")
+            logger.error("Callback error: %s", e)
 
     def stop_polling(self):
         """
@@ -136,9 +188,17 @@ class DetectionEngine:
         From src/lib.rs lines 248-250
         """
         self._is_running = False
+        self._stop_event.set()
         if self._thread and self._thread.is_alive():
             self._thread.join(timeout=5)
 
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+        clear_network_cache()
+
     def is_meeting_active(self) -> bool:
         """
         Check if a meeting is currently active.
@@ -155,22 +215,26 @@ class DetectionEngine:
         Register a callback for when a meeting starts.
         From src/lib.rs lines 259-262
 
+        Registration is expected to be infrequent: it copies the tuple.
+
         Args:
             callback: Function to call with DetectionDetails when meeting starts
         """
         with self._callback_lock:
-            self._start_callbacks.append(callback)
+            self._start_callbacks = self._start_callbacks + (callback,)
 
     def add_end_callback(self, callback: Callable[[DetectionDetails], None]):
         """
         Register a callback for when a meeting ends.
         From src/lib.rs lines 264-267
 
+        Registration is expected to be infrequent: it copies the tuple.
+
         Args:
             callback: Function to call with DetectionDetails when meeting ends
         """
         with self._callback_lock:
-            self._end_callbacks.append(callback)
+            self._end_callbacks = self._end_callbacks + (callback,)
 
     def get_last_details(self) -> Optional[DetectionDetails]:
         """
@@ -180,10 +244,10 @@ class DetectionEngine:
         Returns:
             DetectionDetails from last detection, or None if no detection yet
         """
-        with self._result_lock:
-            if self._last_result is None:
-                return None
-            return DetectionDetails.from_detection_result(self._last_result)
+        result = self._last_result  # Snapshot the reference once
+        if result is None:
+            return None
+        return DetectionDetails.from_detection_result(result)
 
 
 # Global engine instance (singleton pattern)
@@ -204,6 +268,10 @@ def get_engine() -> DetectionEngine:
     """
     global _engine
 
+    engine = _engine
+    if engine is not None:
+        return engine
+
     with _engine_lock:
         if _engine is None:
             _engine = DetectionEngine()
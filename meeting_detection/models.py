@@ -5,8 +5,9 @@ These models mirror the Rust structs from src/lib.rs and src/detector.rs
 to ensure exact API compatibility.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from enum import Enum
+from functools import lru_cache
 from typing import Optional
 
 
@@ -17,6 +18,41 @@ SCORE_MICROPHONE = 2
 SCORE_CAMERA = 1
 
 
+def _frozen_getstate(self):
+    return [getattr(self, f.name) for f in fields(self)]
+
+
+def _frozen_setstate(self, state):
+    for f, value in zip(fields(self), state):
+        object.__setattr__(self, f.name, value)
+
+
+def _with_slots(cls):
+    """
+    Rebuild a dataclass with __slots__ for its fields.
+
+    Equivalent to @dataclass(slots=True), which needs Python 3.10+. Apply it
+    above @dataclass so the generated __init__ keeps the field defaults.
+    """
+    field_names = tuple(f.name for f in fields(cls))
+    cls_dict = dict(cls.__dict__)
+    cls_dict['__slots__'] = field_names
+    for name in field_names:
+        # Class-level defaults would clash with the slot descriptors
+        cls_dict.pop(name, None)
+    cls_dict.pop('__dict__', None)
+    cls_dict.pop('__weakref__', None)
+
+    if cls.__dataclass_params__.frozen:
+        # Default slot unpickling uses setattr, which frozen classes reject
+        cls_dict['__getstate__'] = _frozen_getstate
+        cls_dict['__setstate__'] = _frozen_setstate
+
+    slotted = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    slotted.__qualname__ = cls.__qualname__
+    return slotted
+
+
 class MeetingState(Enum):
     """State of meeting detection (from src/detector.rs lines 11-15)"""
     INACTIVE = "Inactive"
@@ -30,7 +66,8 @@ class DetectionReason(Enum):
     NONE = "none"
 
 
-@dataclass
+@_with_slots
+@dataclass(frozen=True)
 class SignalDetails:
     """
     Signal information with active status and weight.
@@ -40,7 +77,8 @@ class SignalDetails:
     weight: int
 
 
-@dataclass
+@_with_slots
+@dataclass(frozen=True)
 class SignalsBreakdown:
     """
     Breakdown of all detection signals.
@@ -52,7 +90,8 @@ class SignalsBreakdown:
     camera: SignalDetails
 
 
-@dataclass
+@_with_slots
+@dataclass(frozen=True)
 class DetectionDetails:
     """
     Detection details exposed to users via callbacks and API.
@@ -72,17 +111,19 @@ class DetectionDetails:
         """
         Convert internal DetectionResult to public-facing DetectionDetails.
         Maps to detection_result_to_js() in src/lib.rs lines 64-118
+
+        The score and signals breakdown are memoized per combination of
+        signal flags, and the common inactive result maps to a shared
+        instance.
         """
-        # Calculate score for backward compatibility (not used in decision logic)
-        score = 0
-        if result.meeting_app_detected:
-            score += SCORE_MEETING_APP
-        if result.meeting_window_detected:
-            score += SCORE_MEETING_WINDOW
-        if result.microphone_active:
-            score += SCORE_MICROPHONE
-        if result.camera_active:
-            score += SCORE_CAMERA
+        flags = (
+            result.meeting_app_detected,
+            result.meeting_window_detected,
+            result.microphone_active,
+            result.camera_active,
+        )
+        signals = _signals_for(*flags)
+        score = _score_for(*flags)
 
         # Convert reason to string format and extract meeting URL
         if result.reason == DetectionReason.NATIVE_APP_WITH_NETWORK:
@@ -92,6 +133,8 @@ class DetectionDetails:
             reason_str = f"BrowserWithMeetingUrl({result.reason_browser_name or 'Unknown'})"
             meeting_url = result.reason_url
         else:
+            if signals is _NO_SIGNALS and result.meeting_app_name is None and not result.is_meeting_active:
+                return _INACTIVE_DETAILS
             reason_str = "None"
             meeting_url = None
 
@@ -101,28 +144,12 @@ class DetectionDetails:
             app_name=result.meeting_app_name,
             reason=reason_str,
             meeting_url=meeting_url,
-            signals=SignalsBreakdown(
-                meeting_app=SignalDetails(
-                    active=result.meeting_app_detected,
-                    weight=SCORE_MEETING_APP
-                ),
-                meeting_window=SignalDetails(
-                    active=result.meeting_window_detected,
-                    weight=SCORE_MEETING_WINDOW
-                ),
-                microphone=SignalDetails(
-                    active=result.microphone_active,
-                    weight=SCORE_MICROPHONE
-                ),
-                camera=SignalDetails(
-                    active=result.camera_active,
-                    weight=SCORE_CAMERA
-                ),
-            )
+            signals=signals,
         )
 
 
-@dataclass
+@_with_slots
+@dataclass(frozen=True)
 class DetectionResult:
     """
     Internal detection result with detailed breakdown.
@@ -167,7 +194,7 @@ class DetectionResult:
             meeting_window_detected=False,
             microphone_active=microphone,
             camera_active=camera,
-            score=SCORE_MEETING_APP + (SCORE_MICROPHONE if microphone else 0) + (SCORE_CAMERA if camera else 0),
+            score=_score_for(True, False, microphone, camera),
             is_meeting_active=True,
             reason=DetectionReason.NATIVE_APP_WITH_NETWORK,
             reason_app_name=app_name,
@@ -182,7 +209,7 @@ class DetectionResult:
             meeting_window_detected=False,
             microphone_active=microphone,
             camera_active=camera,
-            score=SCORE_MEETING_APP + (SCORE_MICROPHONE if microphone else 0) + (SCORE_CAMERA if camera else 0),
+            score=_score_for(True, False, microphone, camera),
             is_meeting_active=True,
             reason=DetectionReason.BROWSER_WITH_MEETING_URL,
             reason_browser_name=browser_name,
@@ -190,6 +217,39 @@ class DetectionResult:
         )
 
 
+def _score_for(meeting_app: bool, meeting_window: bool, microphone: bool, camera: bool) -> int:
+    """Score for a signal combination (for backward compatibility, not used in decisions)."""
+    return (
+        (SCORE_MEETING_APP if meeting_app else 0) +
+        (SCORE_MEETING_WINDOW if meeting_window else 0) +
+        (SCORE_MICROPHONE if microphone else 0) +
+        (SCORE_CAMERA if camera else 0)
+    )
+
+
+@lru_cache(maxsize=None)
+def _signals_for(meeting_app: bool, meeting_window: bool, microphone: bool, camera: bool) -> SignalsBreakdown:
+    """Shared, immutable SignalsBreakdown for one of the 16 signal combinations."""
+    return SignalsBreakdown(
+        meeting_app=SignalDetails(active=meeting_app, weight=SCORE_MEETING_APP),
+        meeting_window=SignalDetails(active=meeting_window, weight=SCORE_MEETING_WINDOW),
+        microphone=SignalDetails(active=microphone, weight=SCORE_MICROPHONE),
+        camera=SignalDetails(active=camera, weight=SCORE_CAMERA),
+    )
+
+
+_NO_SIGNALS = _signals_for(False, False, False, False)
+
+_INACTIVE_DETAILS = DetectionDetails(
+    active=False,
+    score=0,
+    app_name=None,
+    reason="None",
+    meeting_url=None,
+    signals=_NO_SIGNALS,
+)
+
+
 class MeetingEvent(Enum):
     """Event types for internal engine (from src/lib.rs lines 31-34)"""
     STARTED = "Started"
@@ -2,15 +2,27 @@
 Network connection detection for meeting apps.
 
 CRITICAL: Must match src/network.rs exactly for accuracy parity.
-Uses lsof to detect active network connections indicating meetings.
+Uses psutil (falling back to lsof) to detect active network connections
+indicating meetings.
 """
 
+import re
+import socket
 import subprocess
+import sys
+import threading
+import time
 from dataclasses import dataclass
-from typing import List, Tuple
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 
+import psutil
 
-@dataclass
+from .config import _build_automaton
+from .models import _with_slots
+
+
+@_with_slots
+@dataclass(frozen=True)
 class NetworkConnection:
     """
     Network connection information.
@@ -40,19 +52,50 @@ MEETING_DOMAINS = [
 ]
 
 
+# Multi-pattern matchers for MEETING_DOMAINS: an Aho-Corasick automaton
+# when pyahocorasick is installed, otherwise a single regex alternation
+_DOMAIN_AC = _build_automaton(MEETING_DOMAINS)
+_DOMAIN_RE = re.compile('|'.join(re.escape(d) for d in MEETING_DOMAINS))
+
+
+def _is_meeting_domain(address: str) -> bool:
+    """Check if address contains any meeting domain, in one scan."""
+    if _DOMAIN_AC is not None:
+        return next(_DOMAIN_AC.iter(address), None) is not None
+    return _DOMAIN_RE.search(address) is not None
+
+
 # Meeting service ports for video/audio streaming (from src/network.rs lines 35-48)
-MEETING_VIDEO_PORTS = [
+_MEETING_VIDEO_PORTS = frozenset({
     8801,    # Zoom UDP video/audio
     8802,    # Zoom alternative
     3478,    # STUN (Teams, Webex)
     3479,    # STUN alternative
     3480,    # STUN alternative
     3481,    # STUN alternative
-    9000,    # Webex video range start
-    9999,    # Webex video range end
-    19302,   # Google Meet UDP range start
-    19309,   # Google Meet UDP range end
-]
+})
+WEBEX_VIDEO_PORT_RANGE = range(9000, 10000)         # Webex video 9000-9999
+GOOGLE_MEET_VIDEO_PORT_RANGE = range(19302, 19310)  # Google Meet UDP 19302-19309
+
+# Every meeting video/audio port, including both ranges in full, so
+# `port in MEETING_VIDEO_PORTS` is a single O(1) lookup
+MEETING_VIDEO_PORTS = _MEETING_VIDEO_PORTS.union(
+    WEBEX_VIDEO_PORT_RANGE,
+    GOOGLE_MEET_VIDEO_PORT_RANGE,
+)
+
+
+def is_meeting_video_port(port: int) -> bool:
+    """Check if port is a meeting video/audio port (one set lookup)."""
+    return port in MEETING_VIDEO_PORTS
+
+
+# Connection states reported by lsof in a trailing "(STATE)"; others map to
+# "UNKNOWN". Protocols and states are looked up rather than taken from the
+# parsed row, so every connection shares one interned string per value.
+_STATES = {state: state for state in ("ESTABLISHED", "LISTEN", "CLOSED")}
+
+_PROTOCOLS = {protocol: protocol for protocol in ("TCP", "UDP")}
 
 
 def parse_connection_name(name: str) -> Tuple[str, int, str]:
@@ -68,128 +111,327 @@ def parse_connection_name(name: str) -> Tuple[str, int, str]:
     Returns: (remote_address, remote_port, state)
     """
     # Extract state if present
-    if "ESTABLISHED" in name:
-        state = "ESTABLISHED"
-    elif "LISTEN" in name:
-        state = "LISTEN"
-    elif "CLOSED" in name:
-        state = "CLOSED"
-    else:
-        state = "UNKNOWN"
-
-    # Extract remote address and port
-    # Look for pattern: ->remote:port or remote:port
-    if "->" in name:
-        # Format: local->remote:port
-        arrow_pos = name.find("->")
-        remote_part = name[arrow_pos + 2:]
-
-        if ":" in remote_part:
-            colon_pos = remote_part.find(":")
-            address = remote_part[:colon_pos]
-            port_str = remote_part[colon_pos + 1:].split()[0]
-            try:
-                port = int(port_str)
-            except ValueError:
-                port = 0
-            return (address, port, state)
-    elif ":" in name:
-        # Format: remote:port (no arrow)
-        colon_pos = name.find(":")
-        address = name[:colon_pos]
-        port_str = name[colon_pos + 1:].split()[0]
-        try:
-            port = int(port_str)
-        except ValueError:
-            port = 0
-        return (address, port, state)
-
-    return ("", 0, state)
-
-
-def parse_lsof_output(output: str) -> List[NetworkConnection]:
+    idx = name.rfind("(")
+    state = _STATES.get(name[idx + 1:name.find(")", idx)], "UNKNOWN") if idx >= 0 else "UNKNOWN"
+
+    # Extract remote address and port: the part after the first "->" if
+    # there is one, otherwise the whole name. Address runs up to the first
+    # colon; port is the next whitespace-delimited token.
+    _, arrow, rest = name.partition("->")
+    address, sep, tail = (rest if arrow else name).partition(":")
+    if not sep:
+        return ("", 0, state)
+
+    port_tokens = tail.split(None, 1)
+    try:
+        port = int(port_tokens[0]) if port_tokens else 0
+    except ValueError:
+        port = 0
+    return (address, port, state)
+
+
+def parse_lsof_output(output: Union[str, Iterable[str]]) -> Iterator[NetworkConnection]:
     """
     Parse lsof output to extract network connections.
     From src/network.rs lines 51-86
 
+    Accepts the whole output or an iterable of lines (e.g. a pipe) and
+    yields connections as each line is parsed.
+
     lsof format:
     COMMAND PID USER FD TYPE DEVICE SIZE/OFF NODE NAME
     """
-    connections = []
+    lines = output.splitlines() if isinstance(output, str) else output
 
-    for line in output.splitlines():
-        # Skip header line and empty lines
-        if line.startswith("COMMAND") or not line.strip():
+    for line in lines:
+        # Skip header line
+        if line.startswith("COMMAND"):
             continue
 
-        # Parse lsof format
-        parts = line.split()
+        # Parse lsof format; the NAME field is kept whole in parts[8].
+        # Short (including empty) lines are skipped.
+        parts = line.split(None, 8)
         if len(parts) < 9:
             continue
 
-        process_name = parts[0]
+        # Rows repeat a handful of process names; share one string each
+        process_name = sys.intern(parts[0])
 
-        # Determine protocol
-        if "TCP" in line:
-            protocol = "TCP"
-        elif "UDP" in line:
-            protocol = "UDP"
-        else:
-            protocol = "UNKNOWN"
+        # Determine protocol from the NODE column
+        protocol = _PROTOCOLS.get(parts[7], "UNKNOWN")
 
         # Extract remote address and port from NAME field (last field)
-        name_field = " ".join(parts[8:])
+        name_field = parts[8].rstrip()
 
         # Parse connection info
         remote_address, remote_port, state = parse_connection_name(name_field)
 
-        connections.append(NetworkConnection(
+        yield NetworkConnection(
             process_name=process_name,
             protocol=protocol,
             remote_address=remote_address,
             remote_port=remote_port,
             state=state,
-        ))
+        )
+
+
+# Read sockets through psutil instead of forking lsof each poll. Set to False
+# to use the lsof parser.
+USE_PSUTIL_CONNECTIONS = True
+
+_PSUTIL_PROTOCOLS = {socket.SOCK_STREAM: "TCP", socket.SOCK_DGRAM: "UDP"}
+_PSUTIL_STATES = {
+    psutil.CONN_ESTABLISHED: "ESTABLISHED",
+    psutil.CONN_LISTEN: "LISTEN",
+    psutil.CONN_CLOSE: "CLOSED",
+}
+_WILDCARD_ADDRS = frozenset(("0.0.0.0", "::", ""))
+
+# lsof compares -c arguments against the kernel's (truncated) command name
+_LSOF_COMMAND_MAX = 15
+_LSOF_TIMEOUT_SEC = 5
+
+# Recent lsof snapshots are reused for this long. Kept below the engine's
+# minimum poll interval (0.5s), so each poll still sees fresh data while
+# repeated lookups within one cycle share a single lsof run.
+NETWORK_CACHE_TTL_SEC = 0.4
+_cache = {"t": float("-inf"), "key": None, "conns": []}
+_cache_lock = threading.Lock()
 
-    return connections
 
+def clear_network_cache():
+    """Drop the cached lsof snapshot."""
+    with _cache_lock:
+        _cache["t"] = float("-inf")
+        _cache["key"] = None
+        _cache["conns"] = []
 
-def get_network_connections_for_process(process_name: str) -> List[NetworkConnection]:
+
+def get_network_connections(
+    process_names: Optional[Sequence[str]] = None
+) -> List[NetworkConnection]:
     """
-    Get network connections for a specific process.
-    From src/network.rs lines 134-160
+    Get network connections, optionally limited to some processes.
 
-    Uses lsof -i -P -n to get network connections.
+    Reads sockets through psutil when USE_PSUTIL_CONNECTIONS is set, which
+    avoids forking lsof every poll; otherwise (or when psutil is denied the
+    system-wide table) uses lsof -i -P -n. With process_names, only those
+    processes' sockets are reported. A single snapshot can be shared across
+    several per-process lookups within one poll.
+
+    Results are cached for NETWORK_CACHE_TTL_SEC per set of process names;
+    concurrent callers wait for one lsof run instead of each forking. The
+    returned list may be shared with other callers and must not be mutated.
     Raises RuntimeError if lsof command fails.
     """
+    key = tuple(dict.fromkeys(process_names)) if process_names else None
+
+    with _cache_lock:
+        if _cache["key"] == key and time.monotonic() - _cache["t"] < NETWORK_CACHE_TTL_SEC:
+            return _cache["conns"]
+
+        if USE_PSUTIL_CONNECTIONS:
+            connections = _read_psutil(key)
+        else:
+            connections = _run_lsof(key)
+        _cache["t"] = time.monotonic()
+        _cache["key"] = key
+        _cache["conns"] = connections
+        return connections
+
+
+def _read_psutil(process_names: Optional[Sequence[str]]) -> List[NetworkConnection]:
+    """Build connections from psutil, mirroring what lsof -i -P -n reports."""
+    if process_names:
+        wanted = set(process_names)
+        connections = []
+        for proc in psutil.process_iter(['name']):
+            name = proc.info['name']
+            if name not in wanted:
+                continue
+            try:
+                # net_connections() replaced connections() in psutil 6.0
+                read = getattr(proc, 'net_connections', None) or proc.connections
+                conns = read(kind='inet')
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+            connections.extend(_from_psutil(name, conn) for conn in conns)
+        return connections
+
     try:
-        result = subprocess.run(
-            ['lsof', '-i', '-P', '-n'],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
+        conns = psutil.net_connections(kind='inet')
+    except psutil.AccessDenied:
+        # macOS only exposes the system-wide table to root
+        return _run_lsof(None)
 
-        if result.returncode != 0:
-            raise RuntimeError("Failed to get network connections via lsof")
+    names = {}
+    connections = []
+    for conn in conns:
+        if conn.pid is None:
+            continue
+        name = names.get(conn.pid)
+        if name is None:
+            try:
+                name = psutil.Process(conn.pid).name()
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+            names[conn.pid] = name
+        connections.append(_from_psutil(name, conn))
+    return connections
 
-        all_connections = parse_lsof_output(result.stdout)
 
-        # Filter for the specific process (exact match)
-        process_connections = [
-            conn for conn in all_connections
-            if conn.process_name == process_name
-        ]
+def _from_psutil(process_name: str, conn) -> NetworkConnection:
+    """Convert a psutil connection tuple into a NetworkConnection."""
+    if conn.raddr:
+        address, port = conn.raddr.ip, conn.raddr.port
+    elif conn.laddr:
+        # lsof names unconnected sockets by their local endpoint
+        address = "*" if conn.laddr.ip in _WILDCARD_ADDRS else conn.laddr.ip
+        port = conn.laddr.port
+    else:
+        address, port = "*", 0
+
+    return NetworkConnection(
+        process_name=process_name,
+        protocol=_PSUTIL_PROTOCOLS.get(conn.type, "UNKNOWN"),
+        remote_address=address,
+        remote_port=port,
+        state=_PSUTIL_STATES.get(conn.status, "UNKNOWN"),
+    )
+
+
+def _run_lsof(process_names: Optional[Sequence[str]]) -> List[NetworkConnection]:
+    """Run lsof (optionally limited with -c), parsing rows as they stream in."""
+    # -w: warnings would only pile up in the stderr pipe
+    if process_names:
+        args = ['lsof', '-a', '-i', '-P', '-n', '-w']
+        for name in process_names:
+            args += ['-c', name[:_LSOF_COMMAND_MAX]]
+    else:
+        args = ['lsof', '-i', '-P', '-n', '-w']
 
-        return process_connections
+    timed_out = threading.Event()
 
-    except subprocess.TimeoutExpired:
-        raise RuntimeError("lsof command timed out")
+    try:
+        with subprocess.Popen(
+            args,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True
+        ) as proc:
+            def kill():
+                timed_out.set()
+                proc.kill()
+
+            # Reading the pipe can block, so the deadline is enforced by a
+            # timer rather than proc.wait(timeout=...)
+            timer = threading.Timer(_LSOF_TIMEOUT_SEC, kill)
+            timer.start()
+
+            # Drain stderr alongside stdout so error output can't fill the
+            # pipe and block lsof until the timer kills it
+            stderr_chunks = []
+            drain = threading.Thread(
+                target=lambda stream: stderr_chunks.append(stream.read()),
+                args=(proc.stderr,),
+                daemon=True
+            )
+            drain.start()
+            try:
+                connections = list(parse_lsof_output(proc.stdout))
+                returncode = proc.wait()
+                drain.join()
+            finally:
+                timer.cancel()
+            stderr = "".join(stderr_chunks)
     except FileNotFoundError:
         raise RuntimeError("lsof command not found (macOS required)")
 
+    if timed_out.is_set():
+        raise RuntimeError("lsof command timed out")
+
+    if returncode != 0:
+        # lsof also exits 1 when nothing matched the selection
+        if process_names and not connections and not stderr.strip():
+            return []
+        raise RuntimeError("Failed to get network connections via lsof")
+
+    return connections
+
+
+def get_network_connections_for_process(
+    process_name: str,
+    connections: Optional[List[NetworkConnection]] = None
+) -> List[NetworkConnection]:
+    """
+    Get network connections for a specific process.
+    From src/network.rs lines 134-160
+
+    Args:
+        process_name: Process name to filter on (exact match)
+        connections: Optional prebuilt snapshot from get_network_connections().
+                     If None, lsof is run for this process only (-c).
 
-def detect_meeting_network_activity(process_name: str) -> Tuple[bool, int, List[str]]:
+    Raises RuntimeError if lsof command fails.
+    """
+    if connections is None:
+        connections = get_network_connections([process_name])
+
+    # Filter for the specific process (exact match). lsof -c matches by
+    # prefix, so this still guards against similarly named processes.
+    return [
+        conn for conn in connections
+        if conn.process_name == process_name
+    ]
+
+
+def _is_meeting_connection(conn: NetworkConnection) -> bool:
+    """
+    Check whether a single connection looks like meeting traffic.
+
+    Meeting connection if:
+    1. Meeting domain AND ESTABLISHED (must be active, not just any state), OR
+    2. Meeting domain AND video port (video ports indicate active streaming), OR
+    3. Zoom UDP on port 8801 (Zoom-specific, but not if CLOSED)
+    """
+    # Zoom-specific: UDP port 8801 is a strong indicator
+    # UDP connections often show "UNKNOWN" state, so we check the port
+    # But only if it's a recent/active connection (not CLOSED)
+    if conn.protocol == "UDP" and conn.remote_port == 8801 and conn.state != "CLOSED":
+        return True
+
+    return _is_meeting_domain(conn.remote_address) and (
+        conn.state == "ESTABLISHED" or is_meeting_video_port(conn.remote_port)
+    )
+
+
+def has_meeting_network_activity(
+    process_name: str,
+    connections: Optional[List[NetworkConnection]] = None
+) -> bool:
+    """
+    Check whether a process has any meeting connection.
+
+    Same rules as detect_meeting_network_activity(), but stops at the first
+    match and builds no details; use it where only the boolean matters.
+
+    Args:
+        process_name: Process name to check
+        connections: Optional prebuilt snapshot from get_network_connections()
+    """
+    if connections is None:
+        connections = get_network_connections([process_name])
+
+    return any(
+        conn.process_name == process_name and _is_meeting_connection(conn)
+        for conn in connections
+    )
+
+
+def detect_meeting_network_activity(
+    process_name: str,
+    connections: Optional[List[NetworkConnection]] = None
+) -> Tuple[bool, int, List[str]]:
     """
     CRITICAL: Exact port of Rust logic from src/network.rs lines 169-218
 
@@ -200,50 +442,19 @@ def detect_meeting_network_activity(process_name: str) -> Tuple[bool, int, List[
     - Teams/Webex: STUN ports (3478-3481) or meeting domains with ESTABLISHED
     - Google Meet: Meeting domains with ESTABLISHED or video ports (19302-19309)
 
+    Args:
+        process_name: Process name to check
+        connections: Optional prebuilt snapshot from get_network_connections()
+
     Returns: (has_meeting_connections, connection_count, details)
     """
-    connections = get_network_connections_for_process(process_name)
+    connections = get_network_connections_for_process(process_name, connections)
 
-    meeting_connections = []
-    details = []
-
-    for conn in connections:
-        # Check if connection is to a meeting domain
-        is_meeting_domain = any(
-            domain in conn.remote_address
-            for domain in MEETING_DOMAINS
-        )
-
-        # Check if connection is on a video/audio port
-        is_video_port = conn.remote_port in MEETING_VIDEO_PORTS
-
-        # Check if connection is established (active)
-        is_established = conn.state == "ESTABLISHED"
-
-        # Zoom-specific: UDP port 8801 is a strong indicator
-        # UDP connections often show "UNKNOWN" state, so we check the port
-        # But only if it's a recent/active connection (not CLOSED)
-        is_zoom_udp = (
-            conn.protocol == "UDP" and
-            conn.remote_port == 8801 and
-            conn.state != "CLOSED"
-        )
-
-        # Meeting connection if:
-        # 1. Meeting domain AND ESTABLISHED (must be active, not just any state), OR
-        # 2. Meeting domain AND video port (video ports indicate active streaming), OR
-        # 3. Zoom UDP on port 8801 (Zoom-specific, but not if CLOSED)
-        is_meeting_connection = (
-            (is_meeting_domain and (is_established or is_video_port)) or
-            is_zoom_udp
-        )
-
-        if is_meeting_connection:
-            meeting_connections.append(conn)
-            details.append(
-                f"{conn.protocol} {conn.process_name} "
-                f"{conn.remote_address}:{conn.remote_port} ({conn.state})"
-            )
+    details = [
+        f"{conn.protocol} {conn.process_name} "
+        f"{conn.remote_address}:{conn.remote_port} ({conn.state})"
+        for conn in connections
+        if _is_meeting_connection(conn)
+    ]
 
-    has_meeting = len(meeting_connections) > 0
-    return (has_meeting, len(meeting_connections), details)
+    return (len(details) > 0, len(details), details)
@@ -1,15 +1,377 @@
 """
 macOS-specific implementation for meeting detection.
 
-Uses AppleScript for browser URL extraction and psutil for process management.
+Uses Scripting Bridge or JXA (via osascript) for browser URL extraction and
+psutil/libproc for process management.
 Maps to src/platform/macos.rs
 """
 
+import atexit
+import ctypes
+import functools
+import json
+import os
 import psutil
+import re
+import select
+import shutil
 import subprocess
-from typing import Dict, List
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 from .base import PlatformDetector
-from ..config import is_browser_process_macos
+from ..config import get_running_app_bundle_ids, is_browser_process_macos
+
+try:
+    from AppKit import NSWorkspace, NSWorkspaceDidActivateApplicationNotification
+except ImportError:
+    NSWorkspace = None
+    NSWorkspaceDidActivateApplicationNotification = None
+
+try:
+    from ScriptingBridge import SBApplication  # Optional: pip install meeting-status-py[macos]
+except ImportError:
+    SBApplication = None
+
+
+__all__ = [
+    'MacOSDetector',
+    'is_browser_process',
+    'get_browser_tab_urls',
+    'invalidate_browser_tab_urls_cache',
+    'CACHE_TTL_SEC',
+    'BROWSER_URLS_TTL_SEC',
+    'STALE_POLL_MIN_SEC',
+    'STALE_POLL_MAX_SEC',
+]
+
+
+# Apps that commonly use the camera (matched anywhere in a process name)
+_CAMERA_RE = re.compile(r'zoom|teams|facetime|photo booth|quicktime', re.IGNORECASE)
+
+# Process lists and window titles are reused for this many seconds, so
+# several lookups within one poll (e.g. is_camera_active() and the detector
+# both listing processes) share one enumeration.
+CACHE_TTL_SEC = 1.0
+
+
+def _ttl_cache(func):
+    """
+    Cache a function's result per positional arguments for CACHE_TTL_SEC
+    (read at call time). Cached values are shared and must not be mutated.
+    """
+    cache: Dict[tuple, Tuple[float, object]] = {}
+
+    @functools.wraps(func)
+    def wrapper(*args):
+        now = time.monotonic()
+        hit = cache.get(args)
+        if hit is not None and now - hit[0] < CACHE_TTL_SEC:
+            return hit[1]
+        value = func(*args)
+        cache[args] = (now, value)
+        return value
+
+    wrapper.cache_clear = cache.clear
+    return wrapper
+
+
+# libproc lists every PID and its name with one call each, without building
+# a psutil.Process per PID. Missing off macOS; callers fall back to psutil.
+try:
+    _libproc = ctypes.CDLL('/usr/lib/libproc.dylib')
+except OSError:
+    _libproc = None
+
+_PROC_ALL_PIDS = 1
+_PROC_NAME_MAX = 256
+
+
+def _libproc_process_names() -> Optional[List[str]]:
+    """
+    Names of all running processes via proc_listpids()/proc_name().
+    Returns None if libproc is unavailable or the PID list can't be read.
+    """
+    if _libproc is None:
+        return None
+
+    pid_size = ctypes.sizeof(ctypes.c_int)
+    needed = _libproc.proc_listpids(_PROC_ALL_PIDS, 0, None, 0)
+    if needed <= 0:
+        return None
+
+    # Leave room for processes started since the size query
+    pids = (ctypes.c_int * (needed // pid_size + 64))()
+    filled = _libproc.proc_listpids(_PROC_ALL_PIDS, 0, pids, ctypes.sizeof(pids))
+    if filled <= 0:
+        return None
+
+    name = ctypes.create_string_buffer(_PROC_NAME_MAX)
+    names = []
+    for pid in pids[:filled // pid_size]:
+        if pid and _libproc.proc_name(pid, name, _PROC_NAME_MAX) > 0:
+            names.append(name.value.decode('utf-8', 'replace'))
+    return names
+
+
+# pid -> (create_time, name) for the psutil fallback, guarded by
+# _proc_cache_lock since several detectors may scan at once
+_proc_cache: Dict[int, Tuple[float, str]] = {}
+_proc_cache_lock = threading.Lock()
+
+
+def _psutil_process_names() -> List[str]:
+    """
+    Names of all running processes via psutil. A cached name is reused
+    only while its PID keeps the same create time, so a reused PID is
+    re-read; exited PIDs are dropped.
+    """
+    pids = psutil.pids()
+
+    with _proc_cache_lock:
+        cache = _proc_cache
+
+        live = set(pids)
+        for pid in [pid for pid in cache if pid not in live]:
+            del cache[pid]
+
+        for pid in pids:
+            try:
+                # Process() reads the create time to identify the process
+                proc = psutil.Process(pid)
+                create_time = proc.create_time()
+                cached = cache.get(pid)
+                if cached is None or cached[0] != create_time:
+                    cache[pid] = (create_time, proc.name())
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                cache.pop(pid, None)
+
+        return [name for _create_time, name in cache.values()]
+
+
+@_ttl_cache
+def _running_process_names() -> List[str]:
+    """
+    One process table scan per CACHE_TTL_SEC (libproc, else psutil), shared
+    by MacOSDetector's process list, its camera check and the browser
+    running check. The returned list is shared and must not be mutated.
+    """
+    names = _libproc_process_names()
+    if names is not None:
+        return names
+    return _psutil_process_names()
+
+
+# Tab URLs rarely change between polls, so get_browser_tab_urls() reuses the
+# last result for this many seconds (or until another app is activated).
+BROWSER_URLS_TTL_SEC = 1.5
+_browser_urls_cache = {'ts': float('-inf'), 'val': {}}
+_activation_observer = None
+# Bumped on every app activation; lets poll_if_stale() notice app switches
+_activation_count = 0
+
+# Default poll_if_stale() bounds (same as the engine's POLL_INTERVAL_MIN/MAX)
+STALE_POLL_MIN_SEC = 0.5
+STALE_POLL_MAX_SEC = 10.0
+
+
+# Ends every reply from the persistent osascript session
+_OSA_END = "<<<END>>>"
+
+
+def _load_json(output: bytes, default):
+    """Parse JSON printed by a JXA script; default if empty or malformed."""
+    try:
+        return json.loads(output)
+    except ValueError:
+        return default
+
+
+def _applescript_literal(text: str) -> str:
+    """Quote text as a single-line AppleScript string literal."""
+    escaped = (
+        text.replace('\\', '\\\\')
+        .replace('"', '\\"')
+        .replace('\n', '\\n')
+        .replace('\r', '\\r')
+        .replace('\t', '\\t')
+    )
+    return f'"{escaped}"'
+
+
+class _OsascriptSession:
+    """
+    Long-lived `osascript -i` process, so scripts run without paying for a
+    new osascript launch each time.
+
+    Interactive mode reads one line at a time, so each script is sent as a
+    single `run script ...` line whose result is followed by _OSA_END.
+    The reply format is checked once on startup; if the session can't be
+    started or doesn't behave as expected it is disabled and run() returns
+    None, leaving callers to fall back to a one-shot osascript.
+    """
+
+    def __init__(self):
+        self._proc: Optional[subprocess.Popen] = None
+        self._lock = threading.Lock()
+        self._verified = False
+        self.disabled = False
+
+    def run(self, expression: str, timeout: float) -> Optional[bytes]:
+        """
+        Evaluate a one-line AppleScript expression that returns text and
+        return its result as raw (undecoded) bytes. Returns None if the
+        session is unusable.
+        """
+        with self._lock:
+            if self.disabled:
+                return None
+            try:
+                if self._proc is None:
+                    self._start(timeout)
+                return self._request(expression, timeout)
+            except (OSError, RuntimeError, ValueError):
+                self._stop()
+                # A session that never answered correctly isn't retried
+                if not self._verified:
+                    self.disabled = True
+                return None
+
+    def close(self):
+        """Terminate the osascript process."""
+        with self._lock:
+            self._stop()
+
+    def _start(self, timeout: float):
+        self._proc = subprocess.Popen(
+            ['osascript', '-i'],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            bufsize=0
+        )
+        # Drain stderr so error output can't fill the pipe and block osascript
+        threading.Thread(
+            target=lambda stream: stream.read(),
+            args=(self._proc.stderr,),
+            daemon=True
+        ).start()
+
+        if self._request('"ready"', timeout) != b"ready":
+            raise RuntimeError("unexpected osascript -i reply format")
+        self._verified = True
+
+    def _request(self, expression: str, timeout: float) -> bytes:
+        proc = self._proc
+        proc.stdin.write(f'({expression}) & linefeed & "{_OSA_END}"\n'.encode('utf-8'))
+        proc.stdin.flush()
+
+        fd = proc.stdout.fileno()
+        end = _OSA_END.encode('utf-8')
+        deadline = time.monotonic() + timeout
+        buf = b""
+        while end not in buf:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not select.select([fd], [], [], remaining)[0]:
+                raise RuntimeError("osascript -i timed out")
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                raise RuntimeError("osascript -i exited")
+            buf += chunk
+
+        reply = buf[:buf.index(end)].strip()
+        # Drop the interactive prompt / result markers ahead of the value
+        while reply.startswith((b'>>', b'=>')):
+            reply = reply[2:].lstrip()
+        return reply
+
+    def _stop(self):
+        proc, self._proc = self._proc, None
+        if proc is not None:
+            try:
+                proc.kill()
+                proc.wait(timeout=1)
+            except Exception:
+                pass
+
+
+_osa_session = _OsascriptSession()
+atexit.register(_osa_session.close)
+
+
+# Script source -> compiled .scpt path (None if compiling failed)
+_compiled_scripts: Dict[str, Optional[str]] = {}
+_compiled_dir: Optional[str] = None
+_compile_lock = threading.Lock()
+
+
+def _compile_script(source: str) -> Optional[str]:
+    """
+    Compile a JXA script once with osacompile and return the .scpt path,
+    so later runs skip parsing and compiling the source. Returns None if
+    it can't be compiled; callers then run the source text instead.
+    """
+    global _compiled_dir
+
+    with _compile_lock:
+        if source in _compiled_scripts:
+            return _compiled_scripts[source]
+
+        path = None
+        try:
+            if _compiled_dir is None:
+                _compiled_dir = tempfile.mkdtemp(prefix='meeting-detection-')
+                atexit.register(shutil.rmtree, _compiled_dir, True)
+            path = os.path.join(_compiled_dir, f'{len(_compiled_scripts)}.scpt')
+            result = subprocess.run(
+                ['osacompile', '-l', 'JavaScript', '-o', path, '-e', source],
+                capture_output=True,
+                timeout=5
+            )
+            if result.returncode != 0:
+                path = None
+        except (OSError, subprocess.SubprocessError):
+            path = None
+
+        _compiled_scripts[source] = path
+        return path
+
+
+def _run_osascript(script: str, timeout: float) -> Optional[bytes]:
+    """
+    Run a JXA (JavaScript for Automation) function body and return the
+    text it returns as undecoded bytes, or None if it failed. The output
+    is JSON, which json.loads() reads from bytes directly.
+
+    The script is compiled once and run from its .scpt through the
+    persistent session, falling back to a one-shot osascript. A script
+    error yields "".
+    """
+    # Errors inside the script must still produce a reply
+    wrapped = f'(() => {{ try {{\n{script}\n}} catch (e) {{ return ""; }} }})()'
+
+    compiled = _compile_script(wrapped)
+    if compiled is not None:
+        expression = f'run script (POSIX file {_applescript_literal(compiled)})'
+        args = ['osascript', compiled]
+    else:
+        expression = f'run script {_applescript_literal(wrapped)} in "JavaScript"'
+        args = ['osascript', '-l', 'JavaScript', '-e', wrapped]
+
+    output = _osa_session.run(expression, timeout)
+    if output is not None:
+        return output
+
+    result = subprocess.run(
+        args,
+        capture_output=True,
+        timeout=timeout
+    )
+    if result.returncode != 0:
+        return None
+    return result.stdout
 
 
 class MacOSDetector(PlatformDetector):
@@ -20,7 +382,15 @@ class MacOSDetector(PlatformDetector):
 
     def __init__(self):
         """Initialize the macOS detector."""
-        pass
+        # (monotonic time, titles) of the last get_visible_windows() read
+        self._windows_cache: Tuple[float, List[str]] = (float('-inf'), [])
+        # (process list, result) of the last is_camera_active() check
+        self._camera_memo: Tuple[Optional[List[str]], bool] = (None, False)
+        # poll_if_stale() state
+        self._stale_interval = STALE_POLL_MIN_SEC
+        self._stale_next_poll = float('-inf')
+        self._stale_hash: Optional[int] = None
+        self._stale_activations = -1
 
     def is_microphone_active(self) -> bool:
         """
@@ -42,155 +412,348 @@ class MacOSDetector(PlatformDetector):
         Simplified v1: checks if common camera-using apps are running.
         """
         processes = self.get_running_processes()
-        camera_keywords = ["zoom", "teams", "facetime", "photo booth", "quicktime"]
 
-        has_camera_app = any(
-            any(keyword in p.lower() for keyword in camera_keywords)
-            for p in processes
-        )
+        # The process list is cached, so an unchanged list reuses the answer
+        last_processes, last_result = self._camera_memo
+        if processes is last_processes:
+            return last_result
 
+        has_camera_app = any(_CAMERA_RE.search(p) for p in processes)
+        self._camera_memo = (processes, has_camera_app)
         return has_camera_app
 
     def get_running_processes(self) -> List[str]:
         """
         Get list of running process names.
         From src/platform/macos.rs lines 64-77
-        """
-        processes = []
 
-        for proc in psutil.process_iter(['name']):
-            try:
-                processes.append(proc.info['name'])
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                continue
-
-        return processes
+        Served from the process table snapshot shared with the browser
+        running check (refreshed every CACHE_TTL_SEC); the returned list is
+        shared.
+        """
+        return _running_process_names()
 
     def get_visible_windows(self) -> List[str]:
         """
-        Get list of visible window titles using AppleScript.
+        Get list of visible window titles via System Events (JXA).
         From src/platform/macos.rs lines 79-128
+
+        Cached on the instance for CACHE_TTL_SEC; the returned list is shared.
         """
+        now = time.monotonic()
+        cached_at, titles = self._windows_cache
+        if now - cached_at < CACHE_TTL_SEC:
+            return titles
+
+        titles = self._read_visible_windows()
+        self._windows_cache = (now, titles)
+        return titles
+
+    def _read_visible_windows(self) -> List[str]:
+        """Uncached implementation of get_visible_windows()."""
         script = '''
-            tell application "System Events"
-                set windowList to {}
-                repeat with proc in processes
-                    try
-                        set windowTitles to name of windows of proc
-                        repeat with title in windowTitles
-                            set end of windowList to title
-                        end repeat
-                    end try
-                end repeat
-                set AppleScript's text item delimiters to ", "
-                set resultString to windowList as string
-                set AppleScript's text item delimiters to ""
-                return resultString
-            end tell
+            const procs = Application('System Events').processes;
+            let titles;
+            try {
+                titles = [].concat(...procs.windows.name());
+            } catch (e) {
+                // Some process refused; fall back to asking one at a time
+                titles = [];
+                for (const proc of procs()) {
+                    try {
+                        titles.push(...proc.windows.name());
+                    } catch (e) {}
+                }
+            }
+            return JSON.stringify(titles);
         '''
 
         try:
-            result = subprocess.run(
-                ['osascript', '-e', script],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-
-            if result.returncode != 0:
+            output = _run_osascript(script, timeout=5)
+            if output is None:
                 return []
 
-            titles_str = result.stdout.strip()
-
-            # Parse the AppleScript output (comma-separated)
-            titles = [
-                s.strip()
-                for s in titles_str.split(',')
-                if s.strip() and not s.strip().startswith('item 1 of')
+            # JSON keeps titles containing commas or newlines whole
+            return [
+                title.strip()
+                for title in _load_json(output, [])
+                if isinstance(title, str) and title.strip()
             ]
 
-            return titles
-
         except Exception:
             return []
 
+    def poll_if_stale(
+        self,
+        min_interval: float = STALE_POLL_MIN_SEC,
+        max_interval: float = STALE_POLL_MAX_SEC
+    ) -> bool:
+        """
+        Re-read processes, window titles and browser tabs only when due.
+
+        The wait between reads doubles (up to max_interval) while nothing
+        changes and drops back to min_interval after a change. Activating
+        another app (observed via NSWorkspace when PyObjC is installed)
+        makes the next call poll immediately.
 
-def is_browser_process(process_name: str) -> bool:
+        Returns True if a poll ran and found a change, False otherwise.
+        """
+        _install_activation_observer()
+
+        now = time.monotonic()
+        switched = _activation_count != self._stale_activations
+        if now < self._stale_next_poll and not switched:
+            return False
+        self._stale_activations = _activation_count
+
+        urls = get_browser_tab_urls()
+        snapshot_hash = hash((
+            frozenset(self.get_running_processes()),
+            frozenset(self.get_visible_windows()),
+            frozenset((name, tuple(tab_urls)) for name, tab_urls in urls.items()),
+        ))
+
+        changed = snapshot_hash != self._stale_hash
+        self._stale_hash = snapshot_hash
+        if changed:
+            self._stale_interval = min_interval
+        else:
+            self._stale_interval = min(self._stale_interval * 2, max_interval)
+        self._stale_next_poll = now + self._stale_interval
+        return changed
+
+
+def is_browser_process(
+    process_name: str,
+    running_apps: Optional[Dict[str, str]] = None
+) -> bool:
     """
     Check if a process is a browser using macOS app categories.
     From src/platform/macos.rs lines 135-137
+
+    Args:
+        process_name: Process name to check
+        running_apps: Optional name -> bundle id snapshot for this poll
     """
-    return is_browser_process_macos(process_name)
+    return is_browser_process_macos(process_name, running_apps)
 
 
-def get_browser_tab_urls_generic(applescript_name: str) -> List[str]:
-    """Get URLs from any browser using AppleScript. Works for all Chromium + Safari."""
-    # Safety: verify app is running via System Events (prevents launching it)
-    check_script = f'tell application "System Events" to (name of processes) contains "{applescript_name}"'
-    try:
-        check = subprocess.run(
-            ['osascript', '-e', check_script],
-            capture_output=True, text=True, timeout=3
-        )
-        if check.stdout.strip() != 'true':
-            return []
-    except Exception:
-        return []
+def _tab_urls_script(browsers: Dict[str, str]) -> str:
+    """
+    Build one JXA script that collects the tab URLs of several browsers.
 
-    # Extract tab URLs
-    script = f'''
-        tell application "{applescript_name}"
-            set urlList to {{}}
-            repeat with w in windows
-                repeat with t in tabs of w
-                    set end of urlList to URL of t
-                end repeat
-            end repeat
-            set AppleScript's text item delimiters to ", "
-            set resultString to urlList as string
-            set AppleScript's text item delimiters to ""
-            return resultString
-        end tell
+    Each browser is only addressed if it is running (so the script never
+    launches it), and a failing browser doesn't stop the others. All of a
+    browser's URLs are fetched with one Apple event (`windows.tabs.url()`).
+    Prints a JSON object of browser name -> URLs.
+
+    Args:
+        browsers: browser name -> AppleScript application name
+    """
+    return f'''
+        const result = {{}};
+        for (const [browserName, appName] of {json.dumps(list(browsers.items()))}) {{
+            try {{
+                const app = Application(appName);
+                if (app.running()) {{
+                    result[browserName] = [].concat(...app.windows.tabs.url());
+                }}
+            }} catch (e) {{}}
+        }}
+        return JSON.stringify(result);
     '''
+
+
+def _parse_tab_urls_output(output: bytes) -> Dict[str, List[str]]:
+    """Turn _tab_urls_script() output into browser name -> URLs."""
+    browser_urls = {}
+    parsed = _load_json(output, {})
+    if not isinstance(parsed, dict):
+        return browser_urls
+
+    for browser_name, urls in parsed.items():
+        if not isinstance(urls, list):
+            continue
+        urls = [url for url in urls if isinstance(url, str) and url]
+        if urls:
+            browser_urls[browser_name] = urls
+    return browser_urls
+
+
+def invalidate_browser_tab_urls_cache():
+    """Force the next get_browser_tab_urls() call to query the browsers."""
+    _browser_urls_cache['ts'] = float('-inf')
+
+
+def _on_app_activated(_notification=None):
+    """Record an app switch and drop the cached tab URLs."""
+    global _activation_count
+    _activation_count += 1
+    invalidate_browser_tab_urls_cache()
+
+
+def _install_activation_observer():
+    """
+    Invalidate the tab URL cache whenever another app is activated.
+    No-op without PyObjC; notifications are only delivered while a run loop
+    is running, so the TTL still bounds staleness otherwise.
+    """
+    global _activation_observer
+    if _activation_observer is not None or NSWorkspace is None:
+        return
+
     try:
-        result = subprocess.run(
-            ['osascript', '-e', script],
-            capture_output=True, text=True, timeout=5
+        center = NSWorkspace.sharedWorkspace().notificationCenter()
+        _activation_observer = center.addObserverForName_object_queue_usingBlock_(
+            NSWorkspaceDidActivateApplicationNotification,
+            None,
+            None,
+            _on_app_activated
         )
-        if result.returncode != 0:
-            return []
-        urls_str = result.stdout.strip()
-        return [s.strip() for s in urls_str.split(',') if s.strip()]
     except Exception:
-        return []
+        _activation_observer = False  # Don't retry on every call
 
 
-def get_browser_tab_urls() -> Dict[str, List[str]]:
+def get_browser_tab_urls(
+    running_apps: Optional[Dict[str, str]] = None
+) -> Dict[str, List[str]]:
     """
     Get tab URLs from all running browsers in the registry.
     Returns dict of browser name -> list of URLs.
+
+    Results are cached for BROWSER_URLS_TTL_SEC seconds.
+
+    Args:
+        running_apps: Optional name -> bundle id snapshot for this poll
     """
-    from ..config import BROWSER_REGISTRY
+    _install_activation_observer()
+
+    now = time.monotonic()
+    if now - _browser_urls_cache['ts'] < BROWSER_URLS_TTL_SEC:
+        return _browser_urls_cache['val']
+
+    browser_urls = _fetch_browser_tab_urls(running_apps)
+    _browser_urls_cache['val'] = browser_urls
+    _browser_urls_cache['ts'] = now
+    return browser_urls
 
-    browser_urls = {}
 
-    # Collect running process names once
-    running = set()
-    for proc in psutil.process_iter(['name']):
+def _fetch_browser_tab_urls(
+    running_apps: Optional[Dict[str, str]] = None
+) -> Dict[str, List[str]]:
+    """Uncached implementation of get_browser_tab_urls()."""
+    # Rescanned every poll: NSWorkspace's runningApplications only refreshes
+    # while a main run loop runs, so it can't say which browsers are open
+    candidates = _running_browsers_from_processes()
+
+    # No registered browser in this poll's process snapshot: nothing to ask,
+    # no NSWorkspace lookup, osascript or Apple events. Re-checked every
+    # poll, so a browser opened later is still picked up.
+    if not candidates:
+        return {}
+
+    if NSWorkspace is not None and running_apps is None:
+        running_apps = get_running_app_bundle_ids()
+
+    browser_urls = {}
+    remaining = candidates
+    if SBApplication is not None and running_apps:
+        # NSWorkspace only maps names to bundle ids; a browser opened since
+        # its list was last refreshed falls through to osascript below
+        bridged = {
+            browser_name: applescript_name
+            for browser_name, applescript_name in candidates.items()
+            if applescript_name in running_apps
+        }
+        if bridged:
+            browser_urls.update(_fetch_browser_tab_urls_bridge(bridged, running_apps))
+            remaining = {
+                browser_name: applescript_name
+                for browser_name, applescript_name in candidates.items()
+                if browser_name not in bridged
+            }
+
+    if remaining:
+        # One osascript run for all browsers left
         try:
-            running.add(proc.info['name'])
-        except (psutil.NoSuchProcess, psutil.AccessDenied):
-            continue
+            output = _run_osascript(_tab_urls_script(remaining), timeout=10)
+            if output is not None:
+                browser_urls.update(_parse_tab_urls_output(output))
+        except Exception:
+            pass
 
-    for browser_name, applescript_name in BROWSER_REGISTRY.items():
-        # Check if browser is in running processes (case-insensitive)
-        is_running = any(
-            browser_name.lower() in p.lower() or applescript_name.lower() in p.lower()
-            for p in running
-        )
-        if is_running:
-            urls = get_browser_tab_urls_generic(applescript_name)
-            if urls:
-                browser_urls[browser_name] = urls
+    # Registry order, whichever path read each browser
+    return {
+        browser_name: browser_urls[browser_name]
+        for browser_name in candidates
+        if browser_name in browser_urls
+    }
+
+
+def _running_browsers_from_processes() -> Dict[str, str]:
+    """Registry entries whose name appears in a running process name."""
+    from ..config import _BROWSER_REGISTRY_LC
+
+    # Same snapshot the detector's process list uses this poll, lowercased
+    # once instead of once per registry entry
+    running_lower = {p.lower() for p in _running_process_names()}
+
+    # Check which browsers are in running processes (case-insensitive);
+    # exact names hit the set directly before the substring scan
+    return {
+        browser_name: applescript_name
+        for browser_name, applescript_name, browser_lower, applescript_lower in _BROWSER_REGISTRY_LC
+        if browser_lower in running_lower
+        or applescript_lower in running_lower
+        or any(browser_lower in p or applescript_lower in p for p in running_lower)
+    }
+
+
+# Browsers answer Apple events independently, so their tabs are read in
+# parallel; wall-clock is the slowest browser rather than the sum.
+_TAB_URL_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="md-tabs")
+
+
+def _fetch_browser_tab_urls_bridge(
+    browsers: Dict[str, str],
+    running_apps: Dict[str, str]
+) -> Dict[str, List[str]]:
+    """
+    Read tab URLs in-process through Scripting Bridge, without osascript.
+
+    Args:
+        browsers: running browser name -> AppleScript application name
+        running_apps: app name -> bundle id from get_running_app_bundle_ids()
+    """
+    # Only running browsers are addressed; Scripting Bridge would launch others,
+    # so _bridge_tab_urls() also checks isRunning() before sending any event
+    futures = [
+        (browser_name, _TAB_URL_POOL.submit(_bridge_tab_urls, running_apps[applescript_name]))
+        for browser_name, applescript_name in browsers.items()
+    ]
+
+    # Collected in registry order so the result doesn't depend on timing
+    browser_urls = {}
+    for browser_name, future in futures:
+        urls = future.result()
+        if urls:
+            browser_urls[browser_name] = urls
 
     return browser_urls
+
+
+def _bridge_tab_urls(bundle_id: str) -> List[str]:
+    """Tab URLs of one running browser via Scripting Bridge ([] on failure)."""
+    try:
+        app = SBApplication.applicationWithBundleIdentifier_(bundle_id)
+        if app is None or not app.isRunning():
+            return []
+        # One Apple event per window fetches the URLs of all its tabs
+        return [
+            str(url)
+            for window in app.windows()
+            for url in window.tabs().arrayByApplyingSelector_('URL')
+            if url
+        ]
+    except Exception:
+        return []